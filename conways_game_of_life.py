@@ -18,9 +18,89 @@ Controls:
 - H: Toggle UI visibility
 """
 
+import ctypes
+import glob
+import os
+
 import pygame
 import numpy as np
-import colorsys
+from numba import njit, prange
+from scipy.ndimage import gaussian_filter
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+def _load_simd():
+    """
+    Load the optional life_simd C extension built by setup.py.
+
+    Returns:
+        ctypes.CDLL or None: The library handle, or None if not built
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    for path in glob.glob(os.path.join(here, 'life_simd*.so')):
+        try:
+            lib = ctypes.CDLL(path)
+        except OSError:
+            continue
+        lib.step.argtypes = [ctypes.c_void_p, ctypes.c_void_p,
+                             ctypes.c_void_p, ctypes.c_int, ctypes.c_int]
+        lib.step.restype = None
+        return lib
+    return None
+
+_simd = _load_simd()
+
+# One thread per cell; same branchless rule and age update as the
+# CPU kernels, with modular wrap on both axes.
+_CUDA_KERNEL_SRC = r'''
+extern "C" __global__
+void life_step(const unsigned char *in, unsigned char *out,
+               unsigned char *ages, int rows, int cols)
+{
+    int j = blockIdx.x * blockDim.x + threadIdx.x;
+    int i = blockIdx.y * blockDim.y + threadIdx.y;
+    if (i >= rows || j >= cols)
+        return;
+    int up = (i - 1 + rows) % rows;
+    int dn = (i + 1) % rows;
+    int lf = (j - 1 + cols) % cols;
+    int rt = (j + 1) % cols;
+    int sum = in[up * cols + lf] + in[up * cols + j] + in[up * cols + rt]
+            + in[i * cols + lf] + in[i * cols + rt]
+            + in[dn * cols + lf] + in[dn * cols + j] + in[dn * cols + rt];
+    unsigned char self = in[i * cols + j];
+    unsigned char alive = (sum == 3) || (sum == 2 && self == 1);
+    unsigned char a = ages[i * cols + j];
+    ages[i * cols + j] = (unsigned char)((a + (a < 255)) * (alive & self));
+    out[i * cols + j] = alive;
+}
+'''
+
+_cuda_step = cp.RawKernel(_CUDA_KERNEL_SRC, 'life_step') if cp is not None else None
+
+# Below this cell count, host<->device transfer outweighs the kernel
+CUDA_MIN_CELLS = 1 << 18
+
+def _step_cuda(grid, cell_ages, out):
+    """
+    Advance the grid one generation on the GPU via a CuPy RawKernel.
+
+    Copies grid and ages to the device, launches one thread per cell,
+    and copies the results back into out and cell_ages.
+    """
+    n_rows, n_cols = grid.shape
+    d_in = cp.asarray(grid.astype(np.uint8))
+    d_ages = cp.asarray(cell_ages)
+    d_out = cp.empty_like(d_in)
+    block = (16, 16)
+    blocks = ((n_cols + block[0] - 1) // block[0],
+              (n_rows + block[1] - 1) // block[1])
+    _cuda_step(blocks, block, (d_in, d_out, d_ages, n_rows, n_cols))
+    out[:] = cp.asnumpy(d_out)
+    cell_ages[:] = cp.asnumpy(d_ages)
 
 # Initialize Pygame
 pygame.init()
@@ -42,100 +122,335 @@ cell_size = 12  # Size of each cell in pixels
 cols = width // cell_size  # Number of columns in grid
 rows = height // cell_size  # Number of rows in grid
 
-# Initialize grid with random state (15% chance of live cells)
-grid = np.random.choice([0, 1], size=(rows, cols), p=[0.85, 0.15])
-next_grid = np.zeros((rows, cols))
+# Initialize grid with random state (15% chance of live cells);
+# thresholding uniform samples is much cheaper than np.random.choice,
+# which runs a CDF search per element
+rng = np.random.default_rng()
+grid = (rng.random((rows, cols)) < 0.15).astype(np.uint8)
+next_grid = np.zeros((rows, cols), dtype=np.uint8)
 
 def generate_color_palette(n):
     """
     Generate a smooth color palette for cell aging visualization.
-    
+
+    The HSV-to-RGB conversion (saturation 0.8, value 1.0) uses the
+    standard six-sector formula vectorized over all hues at once
+    instead of per-color colorsys calls.
+
     Args:
         n (int): Number of colors to generate
-        
+
     Returns:
-        list: List of RGB color tuples
+        numpy.array: (n, 3) uint8 array of RGB colors
     """
-    colors = []
-    for i in range(n):
-        hue = i / n
-        rgb = colorsys.hsv_to_rgb(hue, 0.8, 1.0)
-        colors.append([int(255 * x) for x in rgb])
-    return colors
+    s, v = 0.8, 1.0
+    h6 = np.arange(n) * (6.0 / n)
+    c = s * v
+    x = c * (1.0 - np.abs(h6 % 2.0 - 1.0))
+    sector = h6.astype(np.intp) % 6
+    zero = np.zeros(n)
+    full = np.full(n, c)
+    conds = [sector == k for k in range(6)]
+    r = np.select(conds, [full, x, zero, zero, x, full])
+    g = np.select(conds, [x, full, full, x, zero, zero])
+    b = np.select(conds, [zero, zero, x, full, full, x])
+    rgb = np.stack([r, g, b], axis=1) + (v - c)
+    return (rgb * 255).astype(np.uint8)
 
-# Initialize color palette and cell age tracking
+# Initialize color palette as a (256, 3) uint8 lookup table so
+# cell_ages can be mapped to RGB in one fancy-indexing gather
 color_palette = generate_color_palette(256)
-cell_ages = np.zeros((rows, cols))
+cell_ages = np.zeros((rows, cols), dtype=np.uint8)
+
+@njit(inline='always')
+def _count_neighbors(grid, x, y, n_rows, n_cols):
+    """JIT-compiled neighbor count for cell (x, y) with wrapping."""
+    total = 0
+    for i in range(-1, 2):
+        for j in range(-1, 2):
+            if i == 0 and j == 0:  # Skip the cell itself
+                continue
+            total += grid[(x + i) % n_rows, (y + j) % n_cols]
+    return total
 
 def count_neighbors(grid, x, y):
     """
     Count the number of live neighbors for a cell.
-    
+
     Args:
         grid (numpy.array): The current grid state
         x (int): Row index of the cell
         y (int): Column index of the cell
-        
+
     Returns:
         int: Number of live neighbors (0-8)
     """
     rows, cols = grid.shape
-    total = 0
-    for i in range(-1, 2):
-        for j in range(-1, 2):
-            if i == 0 and j == 0:  # Skip the cell itself
-                continue
-            row = (x + i) % rows  # Simplified wrapping
-            col = (y + j) % cols
-            total += grid[row, col]
-    return total
+    return _count_neighbors(grid, x, y, rows, cols)
+
+def pack_grid(g):
+    """
+    Pack a 0/1 byte grid into uint64 words, 64 cells per word.
+
+    Bit c % 64 of word c // 64 holds the cell in column c; columns
+    beyond the grid width are zero padding in the last word.
+
+    Args:
+        g (numpy.array): 0/1 grid of shape (rows, cols)
+
+    Returns:
+        numpy.array: uint64 array of shape (rows, ceil(cols / 64))
+    """
+    g_rows, g_cols = g.shape
+    n_words = (g_cols + 63) // 64
+    padded = np.zeros((g_rows, n_words * 64), dtype=np.uint8)
+    padded[:, :g_cols] = g
+    return np.packbits(padded, axis=1, bitorder='little').view(np.uint64)
+
+def unpack_grid(packed, n_cols):
+    """
+    Unpack a bit-packed grid back into a 0/1 uint8 grid.
+
+    Args:
+        packed (numpy.array): uint64 array produced by pack_grid
+        n_cols (int): Number of columns in the unpacked grid
+
+    Returns:
+        numpy.array: uint8 grid of shape (rows, n_cols)
+    """
+    bits = np.unpackbits(packed.view(np.uint8), axis=1, bitorder='little')
+    return bits[:, :n_cols]
+
+@njit(cache=True)
+def _step_packed(packed, n_cols):
+    """
+    Advance a bit-packed grid one generation with full-adder bit tricks.
+
+    Each uint64 word processes 64 cells at once: the eight neighbor
+    bitplanes are summed with a carry-save adder network, and the
+    Conway rule is derived from the count bits as
+    next = b1 & ~b2 & (b0 | self), i.e. count 3, or alive with count 2.
+    """
+    n_rows, n_words = packed.shape
+    last_bits = n_cols - (n_words - 1) * 64
+    last_mask = np.uint64((1 << last_bits) - 1) if last_bits < 64 else np.uint64(0xFFFFFFFFFFFFFFFF)
+    one = np.uint64(1)
+    out = np.empty_like(packed)
+
+    # West/east shifts with carry across word boundaries and row wrap
+    west = np.empty_like(packed)
+    east = np.empty_like(packed)
+    for r in range(n_rows):
+        for w in range(n_words):
+            if w == 0:
+                carry = (packed[r, n_words - 1] >> np.uint64(last_bits - 1)) & one
+            else:
+                carry = (packed[r, w - 1] >> np.uint64(63)) & one
+            word = (packed[r, w] << one) | carry
+            if w == n_words - 1:
+                word &= last_mask
+            west[r, w] = word
+
+            if w == n_words - 1:
+                east[r, w] = (packed[r, w] >> one) | ((packed[r, 0] & one) << np.uint64(last_bits - 1))
+            else:
+                east[r, w] = (packed[r, w] >> one) | ((packed[r, w + 1] & one) << np.uint64(63))
+
+    for r in range(n_rows):
+        up = (r - 1) % n_rows
+        dn = (r + 1) % n_rows
+        for w in range(n_words):
+            cur = packed[r, w]
+            n0 = packed[up, w]
+            n1 = packed[dn, w]
+            n2 = west[r, w]
+            n3 = east[r, w]
+            n4 = west[up, w]
+            n5 = east[up, w]
+            n6 = west[dn, w]
+            n7 = east[dn, w]
+
+            # Carry-save adder: sum eight bitplanes into count bits b0..b2
+            s_a = n0 ^ n1 ^ n2
+            c_a = (n0 & n1) | (n2 & (n0 ^ n1))
+            s_b = n3 ^ n4 ^ n5
+            c_b = (n3 & n4) | (n5 & (n3 ^ n4))
+            s_c = n6 ^ n7
+            c_c = n6 & n7
+
+            b0 = s_a ^ s_b ^ s_c
+            d = (s_a & s_b) | (s_c & (s_a ^ s_b))
+            s_d = c_a ^ c_b ^ c_c
+            c_d = (c_a & c_b) | (c_c & (c_a ^ c_b))
+            b1 = s_d ^ d
+            e = s_d & d
+            b2 = c_d ^ e
+
+            out[r, w] = b1 & ~b2 & (b0 | cur)
+    return out
+
+@njit(cache=True, parallel=True)
+def _step(grid, cell_ages, out):
+    """
+    Advance the grid one generation, writing the result into out.
+
+    Rows are processed in parallel with prange. The grid is first
+    copied into a torus-padded buffer so the neighbor sum indexes
+    directly with no modulo wrap (an integer divide per access that
+    also blocks vectorization). The rule transition is branchless
+    select-and-mask: next = (n == 3) | (alive & (n == 2)), and ages
+    are a clamped increment multiplied by the survivor mask, so the
+    inner loop compiles without data-dependent branches.
+    Updates cell_ages in place.
+    """
+    n_rows, n_cols = grid.shape
+    pad = np.empty((n_rows + 2, n_cols + 2), dtype=grid.dtype)
+    pad[1:-1, 1:-1] = grid
+    pad[0, 1:-1] = grid[-1]
+    pad[-1, 1:-1] = grid[0]
+    pad[1:-1, 0] = grid[:, -1]
+    pad[1:-1, -1] = grid[:, 0]
+    pad[0, 0] = grid[-1, -1]
+    pad[0, -1] = grid[-1, 0]
+    pad[-1, 0] = grid[0, -1]
+    pad[-1, -1] = grid[0, 0]
+
+    for i in prange(n_rows):
+        for j in range(n_cols):
+            neighbors = (pad[i, j] + pad[i, j + 1] + pad[i, j + 2]
+                         + pad[i + 1, j] + pad[i + 1, j + 2]
+                         + pad[i + 2, j] + pad[i + 2, j + 1] + pad[i + 2, j + 2])
+            alive = grid[i, j] == 1
+            nxt = (neighbors == 3) | (alive & (neighbors == 2))
+            out[i, j] = nxt
+            age = cell_ages[i, j]
+            cell_ages[i, j] = (age + (age < 255)) * (alive & nxt)
+
+def _make_fixed_step(n_rows, n_cols):
+    """
+    Compile a _step variant specialized for a fixed grid shape.
+
+    n_rows and n_cols are frozen into the kernel as compile-time
+    constants, so LLVM knows the exact loop bounds and can drop bounds
+    checks and unroll. The explicit signature forces eager compilation
+    at module load instead of on the first frame.
+
+    Args:
+        n_rows (int): Number of grid rows
+        n_cols (int): Number of grid columns
+
+    Returns:
+        function: Compiled kernel with the same interface as _step
+    """
+    @njit('void(uint8[:,::1], uint8[:,::1], uint8[:,::1])', parallel=True)
+    def step_fixed(grid, cell_ages, out):
+        pad = np.empty((n_rows + 2, n_cols + 2), dtype=np.uint8)
+        pad[1:-1, 1:-1] = grid
+        pad[0, 1:-1] = grid[-1]
+        pad[-1, 1:-1] = grid[0]
+        pad[1:-1, 0] = grid[:, -1]
+        pad[1:-1, -1] = grid[:, 0]
+        pad[0, 0] = grid[-1, -1]
+        pad[0, -1] = grid[-1, 0]
+        pad[-1, 0] = grid[0, -1]
+        pad[-1, -1] = grid[0, 0]
+
+        for i in prange(n_rows):
+            for j in range(n_cols):
+                neighbors = (pad[i, j] + pad[i, j + 1] + pad[i, j + 2]
+                             + pad[i + 1, j] + pad[i + 1, j + 2]
+                             + pad[i + 2, j] + pad[i + 2, j + 1] + pad[i + 2, j + 2])
+                alive = grid[i, j] == 1
+                nxt = (neighbors == 3) | (alive & (neighbors == 2))
+                out[i, j] = nxt
+                age = cell_ages[i, j]
+                cell_ages[i, j] = (age + (age < 255)) * (alive & nxt)
+
+    return step_fixed
+
+# Kernel specialized for the startup grid shape
+_step_fixed = _make_fixed_step(rows, cols)
 
 def update_grid():
     """
     Update the grid according to Conway's Game of Life rules.
     Also handles cell aging for visual effects.
+
+    Uses the CUDA kernel for large grids when CuPy is available, then
+    the SIMD C extension when built, otherwise the JIT-compiled _step
+    kernel (the shape-specialized variant when the grid still has its
+    startup dimensions). grid and next_grid are ping-pong buffers: the
+    new state is written into next_grid and the two swap identities,
+    so no grid copy or allocation happens per tick.
     """
-    global grid, cell_ages
-    next_grid = grid.copy()
-    
-    for i in range(rows):
-        for j in range(cols):
-            neighbors = count_neighbors(grid, i, j)
-            
-            if grid[i, j] == 1:  # Rules for live cells
-                if neighbors < 2 or neighbors > 3:
-                    next_grid[i, j] = 0  # Cell dies
-                    cell_ages[i, j] = 0
-                else:
-                    cell_ages[i, j] = min(255, cell_ages[i, j] + 1)  # Cell ages
-            else:  # Rules for dead cells
-                if neighbors == 3:
-                    next_grid[i, j] = 1  # Cell becomes alive
-                    cell_ages[i, j] = 0
-    
-    grid = next_grid
+    global grid, next_grid, cell_ages
+    if next_grid.shape == grid.shape:
+        out = next_grid
+    else:
+        out = np.zeros_like(grid)
+    if _cuda_step is not None and grid.size >= CUDA_MIN_CELLS:
+        _step_cuda(grid, cell_ages, out)
+    elif _simd is not None and grid.flags.c_contiguous:
+        n_rows, n_cols = grid.shape
+        _simd.step(grid.ctypes.data, out.ctypes.data,
+                   cell_ages.ctypes.data, n_rows, n_cols)
+    elif grid.shape == (rows, cols) and grid.dtype == np.uint8:
+        _step_fixed(grid, cell_ages, out)
+    else:
+        _step(grid, cell_ages, out)
+    if out is next_grid:
+        grid, next_grid = next_grid, grid
+    else:
+        grid = out
+
+# Frame buffer reused across frames for the single-blit draw path
+frame = np.zeros((height, width, 3), dtype=np.uint8)
+
+# Previous rendered state for dirty-rect updates
+prev_grid = None
+prev_ages = None
+# Pixels by which a changed cell's rect is inflated to cover its glow
+GLOW_MARGIN = 4
+# Above this fraction of changed cells a full flip beats per-rect updates
+DIRTY_FRACTION_LIMIT = 0.3
 
 def draw_grid():
     """
     Draw the current state of the grid with enhanced visuals including
     cell colors based on age and glow effects.
+
+    The whole frame is built in a reusable RGB buffer: a palette
+    lookup colors every cell at once, np.repeat upscales cells to
+    pixels, and a box blur of the live-cell layer provides the glow.
+    The finished frame reaches the screen in a single
+    surfarray.blit_array call instead of per-cell rect draws.
+
+    Returns:
+        list or None: Dirty rects to pass to pygame.display.update,
+        or None when the whole display should be flipped
     """
-    screen.fill(BACKGROUND_COLOR)
-    
-    # Draw cells with color based on age and glow effect
-    for i in range(rows):
-        for j in range(cols):
-            if grid[i, j] == 1:
-                age = int(cell_ages[i, j])
-                color = color_palette[age]
-                
-                # Create glow effect with three layers
-                cell_rect = pygame.Rect(j*cell_size, i*cell_size, cell_size-1, cell_size-1)
-                pygame.draw.rect(screen, [c//3 for c in color],
-                               cell_rect.inflate(4, 4))  # Outer glow
-                pygame.draw.rect(screen, [c//2 for c in color],
-                               cell_rect.inflate(2, 2))  # Middle glow
-                pygame.draw.rect(screen, color, cell_rect)  # Cell center
+    global prev_grid, prev_ages
+    # Color only the live cells (~15% density) instead of gathering
+    # palette entries for the whole grid
+    live_i, live_j = np.nonzero(grid)
+    live_rgb = np.zeros(grid.shape + (3,), dtype=np.uint8)
+    live_rgb[live_i, live_j] = color_palette[cell_ages[live_i, live_j]]
+    alive = (grid == 1)[..., None]
+
+    # Upscale cells to pixels and Gaussian-blur the live layer for a
+    # soft glow halo, blended additively onto the frame
+    cells = np.repeat(np.repeat(live_rgb, cell_size, axis=0),
+                      cell_size, axis=1)
+    alive_pix = np.repeat(np.repeat(alive, cell_size, axis=0),
+                          cell_size, axis=1)
+    glow = gaussian_filter(cells, sigma=(2.0, 2.0, 0))
+
+    frame[:] = BACKGROUND_COLOR
+    view = frame[:cells.shape[0], :cells.shape[1]]
+    base = np.where(alive_pix, cells, view).astype(np.uint16)
+    view[:] = np.clip(base + (glow >> 1), 0, 255).astype(np.uint8)
+
+    pygame.surfarray.blit_array(screen, frame.swapaxes(0, 1))
 
     # Draw grid lines for better cell visibility
     if cell_size > 4:
@@ -146,22 +461,83 @@ def draw_grid():
             pygame.draw.line(screen, GRID_COLOR, (j * cell_size, 0),
                            (j * cell_size, height), 1)
 
+    # Collect cells whose appearance changed since the last frame
+    # (state flip, or a surviving cell whose age color advanced)
+    if (prev_grid is None or prev_grid.shape != grid.shape
+            or prev_ages.shape != cell_ages.shape):
+        dirty = None
+    else:
+        changed = (grid != prev_grid) | ((grid == 1) & (cell_ages != prev_ages))
+        ii, jj = np.nonzero(changed)
+        if len(ii) > DIRTY_FRACTION_LIMIT * changed.size:
+            dirty = None  # Full flip is cheaper
+        else:
+            dirty = [pygame.Rect(int(j) * cell_size - GLOW_MARGIN,
+                                 int(i) * cell_size - GLOW_MARGIN,
+                                 cell_size + 2 * GLOW_MARGIN,
+                                 cell_size + 2 * GLOW_MARGIN)
+                     for i, j in zip(ii, jj)]
+    prev_grid = grid.copy()
+    prev_ages = cell_ages.copy()
+    return dirty
+
+# Optional GPU presentation: when enabled, the composed screen surface
+# is streamed into an SDL2 texture once per frame and presented by the
+# GPU, instead of software blits through the display surface
+USE_GPU_RENDER = os.environ.get('GOL_GPU_RENDER', '0') == '1'
+_renderer = None
+_screen_texture = None
+
+def _init_gpu_renderer():
+    """
+    Create an accelerated SDL2 renderer and a streaming texture over
+    the existing display window.
+
+    Returns:
+        bool: True if the renderer is available
+    """
+    global _renderer, _screen_texture
+    try:
+        from pygame._sdl2 import video as sdl2_video
+        window = sdl2_video.Window.from_display_module()
+        _renderer = sdl2_video.Renderer(window, accelerated=1)
+        _screen_texture = sdl2_video.Texture(
+            _renderer, (width, height), streaming=True)
+    except Exception:
+        _renderer = None
+        _screen_texture = None
+    return _renderer is not None
+
+def _present_gpu():
+    """Upload the screen surface to the GPU and present it."""
+    _screen_texture.update(screen)
+    _renderer.clear()
+    _screen_texture.draw()
+    _renderer.present()
+
+# UI text is static, so the font and rendered surfaces are built once
+# on first use and just blitted every frame afterwards
+UI_CONTROLS = [
+    "Controls:",
+    "Space: Pause/Resume",
+    "R: Random Grid",
+    "Click: Toggle Cell",
+    "Esc: Quit"
+]
+_ui_surfaces = None
+
 def draw_ui():
     """
     Draw user interface elements including control instructions.
     """
-    font = pygame.font.Font(None, 24)
-    controls = [
-        "Controls:",
-        "Space: Pause/Resume",
-        "R: Random Grid",
-        "Click: Toggle Cell",
-        "Esc: Quit"
-    ]
-    
+    global _ui_surfaces
+    if _ui_surfaces is None:
+        font = pygame.font.Font(None, 24)
+        _ui_surfaces = [font.render(text, True, WHITE)
+                        for text in UI_CONTROLS]
+
     y = 10
-    for text in controls:
-        surface = font.render(text, True, WHITE)
+    for surface in _ui_surfaces:
         screen.blit(surface, (10, y))
         y += 25
 
@@ -172,6 +548,8 @@ def main():
     running = True
     paused = False
     show_ui = True
+    ui_drawn = not show_ui  # Force a full flip on the first frame
+    gpu = USE_GPU_RENDER and _init_gpu_renderer()
     clock = pygame.time.Clock()
 
     while running:
@@ -183,7 +561,7 @@ def main():
                 if event.key == pygame.K_SPACE:
                     paused = not paused
                 elif event.key == pygame.K_r:
-                    grid[:] = np.random.choice([0, 1], size=(rows, cols), p=[0.85, 0.15])
+                    grid[:] = rng.random((rows, cols)) < 0.15
                     cell_ages.fill(0)
                 elif event.key == pygame.K_ESCAPE:
                     running = False
@@ -201,12 +579,17 @@ def main():
         if not paused:
             update_grid()
         
-        # Draw everything
-        draw_grid()
+        # Draw everything, updating only dirty regions when possible
+        dirty = draw_grid()
         if show_ui:
             draw_ui()
-        
-        pygame.display.flip()
+        if gpu:
+            _present_gpu()
+        elif dirty is None or show_ui != ui_drawn:
+            pygame.display.flip()
+        else:
+            pygame.display.update(dirty)
+        ui_drawn = show_ui
         clock.tick(30)  # Control frame rate
 
     pygame.quit()
@@ -0,0 +1,22 @@
+"""
+Build script for the optional life_simd C extension.
+
+Usage:
+    python setup.py build_ext --inplace
+
+The extension is loaded via ctypes by conways_game_of_life.py when
+present; the game falls back to the Numba kernel without it.
+"""
+
+from setuptools import setup, Extension
+
+setup(
+    name='life_simd',
+    ext_modules=[
+        Extension(
+            'life_simd',
+            sources=['life_simd.c'],
+            extra_compile_args=['-O3'],
+        ),
+    ],
+)
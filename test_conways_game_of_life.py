@@ -53,6 +53,114 @@ def test_color_palette_uniqueness():
     unique_colors = set(tuple(color) for color in palette)
     assert len(unique_colors) > 1
 
+def test_pack_unpack_roundtrip():
+    """Test that packing and unpacking a grid preserves it."""
+    from conways_game_of_life import pack_grid, unpack_grid
+    grid = (np.random.random((66, 100)) < 0.15).astype(np.uint8)
+    packed = pack_grid(grid)
+    assert packed.dtype == np.uint64
+    assert packed.shape == (66, 2)
+    assert np.array_equal(unpack_grid(packed, 100), grid)
+
+def test_step_packed_matches_reference():
+    """Test that the bit-packed step matches the per-cell rules."""
+    from conways_game_of_life import pack_grid, unpack_grid, _step_packed
+    grid = (np.random.random((20, 70)) < 0.3).astype(np.uint8)
+    result = unpack_grid(_step_packed(pack_grid(grid), 70), 70)
+    expected = np.zeros_like(grid)
+    for i in range(20):
+        for j in range(70):
+            neighbors = count_neighbors(grid, i, j)
+            if grid[i, j] == 1:
+                expected[i, j] = 1 if 2 <= neighbors <= 3 else 0
+            else:
+                expected[i, j] = 1 if neighbors == 3 else 0
+    assert np.array_equal(result, expected)
+
+def test_jit_step_matches_reference():
+    """Test that the branchless Numba step matches the per-cell rules."""
+    from conways_game_of_life import _step
+    grid = (np.random.random((20, 70)) < 0.3).astype(np.uint8)
+    ages = np.zeros((20, 70), dtype=np.uint8)
+    out = np.zeros_like(grid)
+    _step(grid, ages, out)
+    expected = np.zeros_like(grid)
+    for i in range(20):
+        for j in range(70):
+            neighbors = count_neighbors(grid, i, j)
+            if grid[i, j] == 1:
+                expected[i, j] = 1 if 2 <= neighbors <= 3 else 0
+            else:
+                expected[i, j] = 1 if neighbors == 3 else 0
+    assert np.array_equal(out, expected)
+
+def test_fixed_step_matches_generic():
+    """Test that the shape-specialized kernel matches the generic one."""
+    import conways_game_of_life as gol
+    grid = (np.random.random((gol.rows, gol.cols)) < 0.3).astype(np.uint8)
+    ages = np.random.randint(0, 255, grid.shape).astype(np.uint8)
+    ages_fixed = ages.copy()
+    out = np.zeros_like(grid)
+    out_fixed = np.zeros_like(grid)
+    gol._step(grid, ages, out)
+    gol._step_fixed(grid, ages_fixed, out_fixed)
+    assert np.array_equal(out_fixed, out)
+    assert np.array_equal(ages_fixed, ages)
+
+def test_simd_step_matches_reference():
+    """Test that the C extension step matches the per-cell rules."""
+    import conways_game_of_life as gol
+    if gol._simd is None:
+        pytest.skip("life_simd extension not built")
+    grid = (np.random.random((20, 70)) < 0.3).astype(np.uint8)
+    ages = np.zeros_like(grid)
+    out = np.zeros_like(grid)
+    gol._simd.step(grid.ctypes.data, out.ctypes.data,
+                   ages.ctypes.data, 20, 70)
+    expected = np.zeros_like(grid)
+    for i in range(20):
+        for j in range(70):
+            neighbors = count_neighbors(grid, i, j)
+            if grid[i, j] == 1:
+                expected[i, j] = 1 if 2 <= neighbors <= 3 else 0
+            else:
+                expected[i, j] = 1 if neighbors == 3 else 0
+    assert np.array_equal(out, expected)
+
+def test_cuda_step_matches_reference():
+    """Test that the CUDA step matches the per-cell rules."""
+    import conways_game_of_life as gol
+    if gol._cuda_step is None:
+        pytest.skip("CuPy not available")
+    grid = (np.random.random((20, 70)) < 0.3).astype(np.uint8)
+    ages = np.zeros_like(grid)
+    out = np.zeros_like(grid)
+    gol._step_cuda(grid, ages, out)
+    expected = np.zeros_like(grid)
+    for i in range(20):
+        for j in range(70):
+            neighbors = count_neighbors(grid, i, j)
+            if grid[i, j] == 1:
+                expected[i, j] = 1 if 2 <= neighbors <= 3 else 0
+            else:
+                expected[i, j] = 1 if neighbors == 3 else 0
+    assert np.array_equal(out, expected)
+
+def test_update_grid_blinker():
+    """Test that update_grid oscillates the blinker pattern."""
+    import conways_game_of_life as gol
+    blinker = np.zeros((5, 5), dtype=np.uint8)
+    blinker[1:4, 2] = 1
+    old_grid, old_ages = gol.grid, gol.cell_ages
+    try:
+        gol.grid = blinker
+        gol.cell_ages = np.zeros((5, 5), dtype=np.uint8)
+        gol.update_grid()
+        assert np.array_equal(gol.grid[2, 1:4], [1, 1, 1])
+        assert gol.grid.sum() == 3
+    finally:
+        gol.grid, gol.cell_ages = old_grid, old_ages
+
 @pytest.fixture
 def sample_grid():
     """Fixture providing a sample grid for testing."""